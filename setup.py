@@ -16,5 +16,12 @@ setup(
     install_requires=[
         'requests'
     ],
+    extras_require={
+        'speed': ['orjson'],
+        'http2': ['httpx[http2]'],
+        'compression': ['brotli', 'zstandard'],
+        'arrow': ['pyarrow'],
+        'typed': ['msgspec']
+    },
     keywords='Sudski Registar, Sudski Registar API'
 )
\ No newline at end of file
@@ -1,13 +1,178 @@
+import copy
+import json
+import logging
+import threading
 import time
 from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from urllib.parse import urlencode
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
 from datetime import datetime, timedelta
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+@lru_cache(maxsize=128)
+def _variable_params(expand_relations, history_columns, offset, limit):
+    """
+        Builds the per-call query parameter items for the given arguments.
+
+        The same few argument combinations (mostly all None) recur on every
+        request in tight paging loops, so the resulting items are memoized
+        and returned as an immutable tuple.
+    """
+    params = []
+    if expand_relations is not None:
+        params.append(("expand_relations", int(expand_relations)))
+    if history_columns is not None:
+        params.append(("history_columns", int(history_columns)))
+    if offset is not None:
+        params.append(("offset", offset))
+    if limit is not None:
+        params.append(("limit", limit))
+    return tuple(params)
+
+
+def _parse_retry_after(value):
+    """
+        Parses a Retry-After header value into a number of seconds.
+
+        The header carries either integer seconds or an HTTP-date; unknown or
+        missing values fall back to a conservative 5 seconds.
+    """
+    if value is None:
+        return 5.0
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 5.0
+    return max(0.0, (retry_at - datetime.now(retry_at.tzinfo)).total_seconds())
+
+
+def _accept_encoding():
+    """
+        Builds the Accept-Encoding header value.
+
+        The registry's JSON payloads are highly repetitive and compress 5-10x,
+        so brotli and zstandard are advertised ahead of gzip whenever their
+        decoders are installed (the 'compression' extra); only encodings that
+        can actually be decoded locally are offered.
+    """
+    encodings = []
+    try:
+        import brotli  # noqa: F401
+        encodings.append("br")
+    except ImportError:
+        pass
+    try:
+        import zstandard  # noqa: F401
+        encodings.append("zstd")
+    except ImportError:
+        pass
+    encodings += ["gzip", "deflate"]
+    return ", ".join(encodings)
+
+
+class _RetryRequest(Exception):
+    """
+        Internal signal that a request should be retried after recovery
+        (token refresh on 401, waiting out a 429).
+    """
+
+
+def _decode(body):
+    """
+        Decodes a JSON response body (bytes or bytearray).
+
+        Uses orjson when it is installed (its C parser is several times faster
+        than the standard library on large paged responses), falling back to
+        the standard library otherwise.
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
 
 
 def basic_auth(username, password):
-    token = b64encode(f"{username}:{password}".encode('utf-8')).decode("ascii")
-    return f'Basic {token}'
+    return 'Basic ' + b64encode(username.encode('utf-8') + b':' + password.encode('utf-8')).decode("ascii")
+
+
+# Declarative table of API endpoints and the kind of parameters they accept:
+# "main" endpoints take the main parameters (snapshot_id, expand_relations,
+# history_columns, ...), "paging" endpoints additionally take offset/limit,
+# and "bare" endpoints take neither.
+_ENDPOINTS = {
+    "bris_pravni_oblici": "main",
+    "bris_registri": "main",
+    "counts": "main",
+    "detalji_subjekta": "main",
+    "djelatnosti_podruznica": "paging",
+    "drzave": "main",
+    "email_adrese": "paging",
+    "email_adrese_podruznica": "paging",
+    "evidencijske_djelatnosti": "paging",
+    "gfi": "paging",
+    "inozemni_registri": "paging",
+    "jezici": "main",
+    "nacionalna_klasifikacija_djelatnosti": "main",
+    "nazivi_podruznica": "paging",
+    "objave_priopcenja": "paging",
+    "postupci": "paging",
+    "pravni_oblici": "paging",
+    "predmeti_poslovanja": "paging",
+    "pretezite_djelatnosti": "paging",
+    "prijevodi_skracenih_tvrtki": "paging",
+    "prijevodi_tvrtki": "paging",
+    "promjene": "paging",
+    "sjedista": "paging",
+    "sjedista_podruznica": "paging",
+    "skraceni_nazivi_podruznica": "paging",
+    "skracene_tvrtke": "paging",
+    "snapshots": "bare",
+    "statusi": "main",
+    "subjekti": "paging",
+    "sudovi": "main",
+    "temeljni_kapitali": "paging",
+    "tvrtke": "paging",
+    "valute": "main",
+    "vrste_gfi_dokumenata": "main",
+    "vrste_postupaka": "main",
+    "vrste_pravnih_oblika": "main",
+}
+
+# Allowed values for the tip_identifikatora argument of get_detalji_subjekta.
+_TIP_IDENT_VALID = frozenset({"oib", "mbs"})
+
+# Codebook endpoints return slowly-changing reference data, so their
+# responses are cached in-process for a while instead of being re-fetched
+# on every call.
+_CODEBOOK_ENDPOINTS = frozenset({
+    "bris_pravni_oblici",
+    "bris_registri",
+    "drzave",
+    "jezici",
+    "nacionalna_klasifikacija_djelatnosti",
+    "statusi",
+    "sudovi",
+    "valute",
+    "vrste_gfi_dokumenata",
+    "vrste_postupaka",
+    "vrste_pravnih_oblika",
+})
 
 
 class SudskiRegistarDataAPI:
@@ -31,7 +196,7 @@ class SudskiRegistarDataAPI:
         total_count (int): The total number of available records.
    """
 
-    def __init__(self, client_id, client_secret, production=False, public=True):
+    def __init__(self, client_id, client_secret, production=False, public=True, http2=False, prefetch=False):
         """
             Initializes the SudskiRegistarAPI with client ID and client secret.
 
@@ -40,6 +205,11 @@ class SudskiRegistarDataAPI:
                 client_secret (str): Client secret for the Sudski Registar Data API.
                 production (bool): Whether to use the production Sudski Registar Data API.
                 public (bool): Whether to use the public Sudski Registar Data API.
+                http2 (bool): Whether to use an HTTP/2 client so concurrent page
+                    requests are multiplexed over one connection. Requires the
+                    optional httpx dependency; falls back to requests without it.
+                prefetch (bool): Whether to warm the codebook cache concurrently
+                    at construction time.
         """
         if production:
             self.base_url = "https://sudreg-data.gov.hr/api/"
@@ -51,8 +221,11 @@ class SudskiRegistarDataAPI:
         else:
             self.base_url_api = self.base_url + "drzavna_tijela/"
 
+        self._urls = {name: self.base_url_api + name for name in _ENDPOINTS}
+
         self.client_id = client_id
         self.client_secret = client_secret
+        self._basic_auth_header = basic_auth(client_id, client_secret)
         self.requests_per_minute = 6
         self.token = ""
         self.snapshot_id = None
@@ -61,6 +234,23 @@ class SudskiRegistarDataAPI:
         self.last_request_time = datetime.now() - timedelta(seconds=60)
         self.seconds_between_requests = int(60 / self.requests_per_minute)
         self.total_count = 0
+        self._rebuild_base_params()
+
+        self._bucket_capacity = self.requests_per_minute
+        self._bucket_rate = self.requests_per_minute / 60.0
+        self._bucket_tokens = float(self._bucket_capacity)
+        self._bucket_last = time.monotonic()
+        self._bucket_lock = threading.Lock()
+
+        self._cache = {}
+        self._cache_ttl = 3600
+        self._warned_uncompressed = False
+        self._local = threading.local()
+        self._metrics = {}
+        self._metrics_lock = threading.Lock()
+
+        self._token_expiry = 0
+        self._session = self._build_session(http2)
 
         if not self.token:
             self.get_token()
@@ -69,6 +259,216 @@ class SudskiRegistarDataAPI:
             'Authorization': 'Bearer ' + self.token,
             'Content-Type': 'application/json',
         }
+        self._session.headers.update(self.headers)
+
+        if prefetch:
+            self.prefetch_codebooks()
+
+    def get_typed(self, endpoint, row_type, **params):
+        """
+            Fetches an endpoint and decodes the response directly into typed objects.
+
+            msgspec parses the raw bytes straight into the given Struct type
+            with no intermediate dicts, which roughly halves decode time and
+            allocates far less than dict rows on the hot paged endpoints. The
+            row schemas are supplied by the caller, since the registry's field
+            sets evolve with the API version and callers usually only need a
+            subset anyway. Requires the optional msgspec dependency ('typed' extra).
+
+            Args:
+                endpoint (str): The endpoint to download, e.g. "subjekti".
+                row_type: The msgspec type to decode into, e.g. list[SubjektRow].
+                **params: Query parameters accepted by the endpoint.
+
+            Returns:
+                The decoded response as an instance of row_type.
+
+           Raises:
+               ImportError: If msgspec is not installed.
+               requests.HTTPError: If the API response was unsuccessful.
+        """
+        try:
+            import msgspec
+        except ImportError:
+            raise ImportError("get_typed requires msgspec; install it with the 'typed' extra")
+        query = self._build_params(endpoint,
+                                   params.pop("expand_relations", None),
+                                   params.pop("history_columns", None),
+                                   params.pop("offset", None),
+                                   params.pop("limit", None),
+                                   params)
+        url = self._urls.get(endpoint) or self.base_url_api + endpoint
+        content = self._execute(endpoint, url, query, raw=True)
+        return msgspec.json.decode(content, type=row_type)
+
+    def get_arrow_table(self, endpoint, **params):
+        """
+            Returns an endpoint's rows as a columnar pyarrow Table.
+
+            The dict-of-dicts shape returned by the regular getters keeps every
+            small value as a separate Python object; for analytics over the
+            large paged tables a columnar table is far more compact and cache
+            friendly. Requires the optional pyarrow dependency ('arrow' extra).
+
+            Args:
+                endpoint (str): The endpoint to download, e.g. "subjekti".
+                **params: Query parameters accepted by the endpoint.
+
+            Returns:
+                pyarrow.Table: The rows of the response as a columnar table.
+
+           Raises:
+               ImportError: If pyarrow is not installed.
+               requests.HTTPError: If the API response was unsuccessful.
+        """
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError("get_arrow_table requires pyarrow; install it with the 'arrow' extra")
+        rows = self._request(endpoint, **params)
+        if not isinstance(rows, list):
+            rows = [rows]
+        return pyarrow.Table.from_pylist(rows)
+
+    def fetch_many(self, endpoints, concurrency=4):
+        """
+            Fetches several independent endpoints concurrently.
+
+            Callers that join multiple tables (e.g. subjekti + sjedista +
+            pravni_oblici) would otherwise pay their round-trips one after
+            another; the requests are independent GETs, so they are overlapped
+            on the shared session, still bounded by the rate limiter.
+
+            Args:
+                endpoints (iterable): Endpoint names, or (endpoint, params) pairs
+                    where params is a dict of query arguments for the endpoint.
+                concurrency (int, optional): The number of concurrent requests.
+
+            Returns:
+                dict: A mapping from endpoint name to the response from the API.
+
+           Raises:
+               requests.HTTPError: If an API response was unsuccessful.
+        """
+        specs = []
+        for entry in endpoints:
+            if isinstance(entry, str):
+                specs.append((entry, {}))
+            else:
+                endpoint, params = entry
+                specs.append((endpoint, params or {}))
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {executor.submit(self._request, endpoint, **params): endpoint
+                       for endpoint, params in specs}
+            return {futures[future]: future.result() for future in as_completed(futures)}
+
+    def batch(self, *specs, concurrency=4):
+        """
+            Executes several endpoint requests concurrently, returning the
+            results in call order.
+
+            The API has no server-side batch endpoint, so the coalescing is
+            client-side: the requests go out together over the shared session
+            (one multiplexed connection with the http2 backend) instead of one
+            round-trip after another, and unlike fetch_many the same endpoint
+            may appear more than once with different parameters.
+
+            Args:
+                *specs: Endpoint names, or (endpoint, params) pairs where params
+                    is a dict of query arguments for the endpoint.
+                concurrency (int, optional): The number of concurrent requests.
+
+            Returns:
+                list: The responses from the API, in the same order as specs.
+
+           Raises:
+               requests.HTTPError: If an API response was unsuccessful.
+        """
+        normalized = [(spec, {}) if isinstance(spec, str) else (spec[0], spec[1] or {})
+                      for spec in specs]
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [executor.submit(self._request, endpoint, **params)
+                       for endpoint, params in normalized]
+            return [future.result() for future in futures]
+
+    def get_all_tables(self, workers=8):
+        """
+            Downloads every table and codebook endpoint concurrently.
+
+            "Download the whole snapshot" workflows call each getter once; doing
+            that serially costs the sum of all round-trips, while fanning the
+            requests out over the shared session overlaps them (the rate limiter
+            still applies). detalji_subjekta is skipped because it requires a
+            subject identifier. Paged endpoints return their first page only;
+            use iter_all or iter_rows to drain a whole table.
+
+            Args:
+                workers (int, optional): The number of concurrent requests.
+
+            Returns:
+                dict: A mapping from endpoint name to the response from the API.
+
+           Raises:
+               requests.HTTPError: If an API response was unsuccessful.
+        """
+        endpoints = [name for name in _ENDPOINTS if name != "detalji_subjekta"]
+        return self.fetch_many(endpoints, concurrency=workers)
+
+    def prefetch_codebooks(self, concurrency=4):
+        """
+            Warms the codebook cache by fetching the most used codebooks concurrently.
+
+            Typical usage joins subject lookups against the country, language and
+            BRIS codebooks; fetching them up front overlaps their round-trips
+            instead of paying one full round-trip each on first use. Every request
+            goes through the shared session and the rate limiter.
+
+            Args:
+                concurrency (int, optional): The number of concurrent requests.
+
+           Raises:
+               requests.HTTPError: If an API response was unsuccessful.
+        """
+        codebooks = (self.get_drzave, self.get_jezici, self.get_bris_pravni_oblici, self.get_bris_registri)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for future in [executor.submit(codebook) for codebook in codebooks]:
+                future.result()
+
+    def _build_session(self, http2):
+        """
+            Builds the HTTP session used for all API requests.
+
+            When http2 is requested and httpx is installed, an httpx.Client with
+            HTTP/2 enabled is returned so concurrent requests share a single
+            multiplexed TLS connection; otherwise a pooled requests.Session with
+            a retry policy is used.
+        """
+        if http2:
+            try:
+                import httpx
+            except ImportError:
+                http2 = False
+            else:
+                return httpx.Client(http2=True, timeout=30,
+                                    limits=httpx.Limits(max_connections=8, max_keepalive_connections=8))
+        session = requests.Session()
+        retry = Retry(total=5, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504],
+                      allowed_methods=["GET", "POST"])
+        session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+        session.headers['Accept-Encoding'] = _accept_encoding()
+        return session
+
+    def close(self):
+        """
+            Closes the underlying HTTP session and releases the connection pool.
+        """
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def get_total_count(self):
         return self.total_count
@@ -77,6 +477,10 @@ class SudskiRegistarDataAPI:
         """
             Executes a GET request to the Sudski Registar Data API.
 
+            Every endpoint method funnels through here (via _request), so
+            session reuse, caching, retries and decoding are applied in one
+            place rather than per method.
+
             Args:
                 endpoint (str): The endpoint for the API request.
                 params (dict): The parameters for the API request.
@@ -87,12 +491,299 @@ class SudskiRegistarDataAPI:
            Raises:
                requests.HTTPError: If the API response was unsuccessful.
         """
+        url = self._urls.get(endpoint) or self.base_url_api + endpoint
+        return self._execute(endpoint, url, params)
+
+    def _execute(self, endpoint, url, params, raw=False):
+        """
+            Runs the request pipeline (cache, token refresh, throttling, GET, decode)
+            for a fully resolved URL.
+
+            Args:
+                endpoint (str): The endpoint for the API request.
+                url (str): The URL for the API request, possibly with a pre-encoded query string.
+                params (dict): The parameters for the API request, or None when
+                    they are already encoded into the URL.
+                raw (bool): Whether to return the undecoded response bytes
+                    instead of the parsed dictionary; raw responses bypass the
+                    codebook cache.
+
+            Returns:
+                dict: The response from the API as a dictionary, or bytes when raw.
+
+           Raises:
+               requests.HTTPError: If the API response was unsuccessful.
+        """
         self.total_count = 0
+        cache_key = None
+        cached = None
+        conditional_headers = None
+        if endpoint in _CODEBOOK_ENDPOINTS and not raw:
+            cache_key = (endpoint, tuple(sorted(params.items())))
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                if time.monotonic() < cached[0]:
+                    self.total_count = cached[2]
+                    return copy.deepcopy(cached[1])
+                # The entry expired; revalidate it with a conditional GET so an
+                # unchanged codebook costs a 304 with no body instead of a
+                # full download and parse.
+                conditional_headers = {}
+                if cached[3] is not None:
+                    conditional_headers['If-None-Match'] = cached[3]
+                if cached[4] is not None:
+                    conditional_headers['If-Modified-Since'] = cached[4]
+                if not conditional_headers:
+                    conditional_headers = None
+        self._ensure_token()
         self.throttle_requests(endpoint)
-        response = requests.get(self.base_url_api + endpoint, headers=self.headers, params=params)
+        # Paged responses can run to megabytes; streaming them defers the body
+        # download until the status is known, so 401/429 retries never pull the
+        # body over the wire. httpx streams through a different API, so the
+        # flag only applies to the requests backend.
+        stream = _ENDPOINTS.get(endpoint) == "paging" and isinstance(self._session, requests.Session)
+        for attempt in range(3):
+            self._acquire()
+            # An empty params dict still costs requests a merge-and-encode pass,
+            # so zero-argument calls (get_statusi, get_vrste_postupaka, ...) send
+            # the precomputed bare URL instead.
+            response = self._session.get(url, params=params or None, stream=True) if stream \
+                else self._session.get(url, params=params or None, headers=conditional_headers)
+            if response.status_code == 304 and cached is not None:
+                self._cache[cache_key] = (time.monotonic() + self._cache_ttl,) + cached[1:]
+                self.total_count = cached[2]
+                return copy.deepcopy(cached[1])
+            try:
+                data = self._check_and_parse(response, raw, endpoint)
+                break
+            except _RetryRequest:
+                response.close()
+                if attempt == 2:
+                    response.raise_for_status()
+                    raise
+        if cache_key is not None:
+            self._cache[cache_key] = (time.monotonic() + self._cache_ttl, copy.deepcopy(data), self.total_count,
+                                      response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        return data
+
+    def _check_and_parse(self, response, raw=False, endpoint=None):
+        """
+            Checks a response status and parses its body in a single pass.
+
+            A 401 refreshes the OAuth token and signals a retry; a 429 waits out
+            the server's Retry-After hint before signalling a retry. Any other
+            error status raises, and a successful body is read and decoded once.
+
+            Returns:
+                dict: The response from the API as a dictionary.
+
+           Raises:
+               _RetryRequest: If the request should be retried after recovery.
+               requests.HTTPError: If the API response was unsuccessful.
+        """
+        if response.status_code == 401:
+            self._token_expiry = 0
+            self._ensure_token()
+            raise _RetryRequest
+        if response.status_code == 429:
+            time.sleep(_parse_retry_after(response.headers.get('Retry-After')))
+            with self._bucket_lock:
+                self._bucket_tokens = 0.0
+                self._bucket_last = time.monotonic()
+            raise _RetryRequest
         response.raise_for_status()  # Raises a HTTPError if the response was unsuccessful
         self.total_count = int(response.headers.get('X-Total-Count', 0))
-        return response.json()
+        content_encoding = response.headers.get('Content-Encoding')
+        logger.debug("GET %s -> %s (Content-Encoding: %s)",
+                     response.url, response.status_code, content_encoding or "identity")
+        start = time.perf_counter_ns()
+        body = self._read_body(response)
+        read_done = time.perf_counter_ns()
+        data = bytes(body) if raw else _decode(body)
+        decode_done = time.perf_counter_ns()
+        if endpoint is not None:
+            self._record_timing(endpoint, read_done - start, decode_done - read_done, len(body))
+        if content_encoding is None and not self._warned_uncompressed and len(body) > 262144:
+            self._warned_uncompressed = True
+            logger.warning("Received a large uncompressed response (%d bytes); "
+                           "the server is ignoring Accept-Encoding", len(body))
+        return data
+
+    def _record_timing(self, endpoint, read_ns, decode_ns, size):
+        """
+            Accumulates body-read and decode timings for one response.
+        """
+        with self._metrics_lock:
+            entry = self._metrics.setdefault(endpoint, {"requests": 0, "read_ms": 0.0,
+                                                        "decode_ms": 0.0, "bytes": 0})
+            entry["requests"] += 1
+            entry["read_ms"] += read_ns / 1e6
+            entry["decode_ms"] += decode_ns / 1e6
+            entry["bytes"] += size
+
+    def get_timings(self):
+        """
+            Returns the accumulated per-endpoint timing statistics.
+
+            For each endpoint: the number of requests, the total body read and
+            JSON decode times in milliseconds, and the total body bytes. For
+            streamed pages the read time approximates network transfer time.
+            This shows whether the network or the parse dominates for a given
+            workload before reaching for further tuning (compression,
+            concurrency, typed decoding).
+
+            Returns:
+                dict: A mapping from endpoint name to its timing statistics.
+        """
+        with self._metrics_lock:
+            return copy.deepcopy(self._metrics)
+
+    def _read_body(self, response):
+        """
+            Reads a response body, recycling a per-thread buffer for streamed pages.
+
+            Streamed paged downloads would otherwise allocate and free a fresh
+            multi-megabyte bytes object per page; reading into one bytearray per
+            worker thread keeps that allocation warm across pages. Responses
+            that were not streamed (or come from the httpx backend) just return
+            their already-buffered content.
+        """
+        if getattr(response, '_content_consumed', True):
+            return response.content
+        buf = getattr(self._local, 'buf', None)
+        if buf is None:
+            buf = self._local.buf = bytearray()
+        del buf[:]
+        for chunk in response.iter_content(65536):
+            buf += chunk
+        return buf
+
+    def _get_page(self, endpoint, offset, limit):
+        """
+            Fetches one page of a paged endpoint using the pre-encoded stable
+            query string, so the per-page URL is a cheap format instead of a
+            full dict urlencode.
+        """
+        url = self._urls[endpoint]
+        if self._base_qs:
+            url = f"{url}?{self._base_qs}&offset={offset}&limit={limit}"
+        else:
+            url = f"{url}?offset={offset}&limit={limit}"
+        return self._execute(endpoint, url, None)
+
+    def _request(self, endpoint, expand_relations=None, history_columns=None, offset=None, limit=None, **extra):
+        """
+            Builds the parameters for an endpoint based on the _ENDPOINTS table
+            and executes the GET request.
+
+            Args:
+                endpoint (str): The endpoint for the API request.
+                expand_relations (bool, optional): Specifies whether data from linked codebooks is added.
+                history_columns (bool, optional): Specifies whether the history columns are included.
+                offset (int, optional): Specifies the starting row for paging.
+                limit (int, optional): Specifies the number of rows (page size) for paging.
+                **extra: Additional endpoint-specific query parameters, omitted when None.
+
+            Returns:
+                dict: The response from the API as a dictionary.
+
+           Raises:
+               requests.HTTPError: If the API response was unsuccessful.
+        """
+        params = self._build_params(endpoint, expand_relations, history_columns, offset, limit, extra)
+        return self.execute_get_request(endpoint, params)
+
+    def _build_params(self, endpoint, expand_relations, history_columns, offset, limit, extra):
+        """
+            Builds the query parameters for an endpoint based on the _ENDPOINTS table.
+        """
+        kind = _ENDPOINTS[endpoint]
+        if kind == "paging":
+            params = self.paging_parameters(expand_relations, offset, limit)
+        elif kind == "main":
+            params = self.main_parameters(expand_relations, history_columns)
+        else:
+            params = {}
+            if self.no_data_error is not None:
+                params["no_data_error"] = self.no_data_error
+            if self.omit_nulls is not None:
+                params["omit_nulls"] = self.omit_nulls
+        for key, value in extra.items():
+            if value is not None:
+                params[key] = value
+        return params
+
+    def iter_all(self, endpoint, limit=1000, concurrency=4):
+        """
+            Iterates over all pages of a paged endpoint.
+
+            The first page is fetched to learn the total row count from the
+            X-Total-Count header, after which the remaining pages are fetched
+            concurrently on the shared session. Every request still goes
+            through the rate limiter, so the requests_per_minute limit is
+            respected. Pages are yielded as they complete, so their order is
+            not guaranteed.
+
+            Args:
+                endpoint (str): The paged endpoint to download, e.g. "tvrtke".
+                limit (int, optional): Specifies the number of rows (page size) per request.
+                concurrency (int, optional): The number of concurrent page requests.
+
+            Yields:
+                dict: One page of the response, as returned by the API.
+
+           Raises:
+               ValueError: If the endpoint is not a paged endpoint.
+               requests.HTTPError: If the API response was unsuccessful.
+        """
+        if _ENDPOINTS.get(endpoint) != "paging":
+            raise ValueError(endpoint + " is not a paged endpoint")
+        first_page = self._get_page(endpoint, 0, limit)
+        total = self.total_count
+        yield first_page
+        offsets = range(limit, total, limit)
+        if not offsets:
+            return
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [executor.submit(self._get_page, endpoint, offset, limit)
+                       for offset in offsets]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def iter_rows(self, endpoint, limit=1000, **params):
+        """
+            Iterates lazily over all rows of a paged endpoint, in order.
+
+            Unlike iter_all, pages are delivered in offset order and flattened
+            into rows, so callers do not need to collect pages into one big
+            list. While the caller consumes a page, the next page is already
+            being fetched in the background, overlapping the round-trip with
+            processing while keeping memory linear in the page size.
+
+            Args:
+                endpoint (str): The paged endpoint to download, e.g. "subjekti".
+                limit (int, optional): Specifies the number of rows (page size) per request.
+                **params: Additional endpoint-specific query parameters.
+
+            Yields:
+                dict: One row of the response, as returned by the API.
+
+           Raises:
+               ValueError: If the endpoint is not a paged endpoint.
+               requests.HTTPError: If the API response was unsuccessful.
+        """
+        if _ENDPOINTS.get(endpoint) != "paging":
+            raise ValueError(endpoint + " is not a paged endpoint")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            offset = 0
+            future = executor.submit(self._request, endpoint, offset=offset, limit=limit, **params)
+            while future is not None:
+                page = future.result()
+                rows = page if isinstance(page, list) else [page]
+                offset += limit
+                future = executor.submit(self._request, endpoint, offset=offset, limit=limit, **params) \
+                    if len(rows) >= limit else None
+                yield from rows
 
     def throttle_requests(self, endpoint):
         """
@@ -108,6 +799,28 @@ class SudskiRegistarDataAPI:
                 time.sleep(sleep_time)
             self.last_request_time = datetime.now()
 
+    def _acquire(self):
+        """
+            Withdraws one request from the client-side token bucket.
+
+            The bucket refills at requests_per_minute tokens per minute up to
+            requests_per_minute capacity; when empty, the call sleeps until one
+            token is available. This smooths bursts so the server-side limit
+            is not tripped. Safe to call from multiple threads.
+        """
+        with self._bucket_lock:
+            now = time.monotonic()
+            self._bucket_tokens = min(self._bucket_capacity,
+                                      self._bucket_tokens + (now - self._bucket_last) * self._bucket_rate)
+            self._bucket_last = now
+            if self._bucket_tokens < 1:
+                sleep_time = (1 - self._bucket_tokens) / self._bucket_rate
+                time.sleep(sleep_time)
+                self._bucket_last = time.monotonic()
+                self._bucket_tokens = 0.0
+            else:
+                self._bucket_tokens -= 1
+
     def get_token(self):
         """
             Sends a request to the Sudski Registar Data API to get an access token.
@@ -116,15 +829,32 @@ class SudskiRegistarDataAPI:
                Exception: Get OAuth 2.0 token was unsuccessful.
         """
         url = self.base_url + "oauth/token"
-        headers = { 'Authorization' : basic_auth(self.client_id, self.client_secret) }
+        headers = { 'Authorization' : self._basic_auth_header }
         payload = { "grant_type": "client_credentials" }
 
-        response = requests.post(url, headers=headers, data=payload)
+        response = self._session.post(url, headers=headers, data=payload)
         if response.status_code == 200:
-            self.token = response.json()["access_token"]
+            token_data = _decode(response.content)
+            self.token = token_data["access_token"]
+            self._token_expiry = time.monotonic() + int(token_data.get("expires_in", 3600)) - 60
         else:
             raise Exception("Error getting token: " + response.text)
 
+    def _ensure_token(self):
+        """
+            Refreshes the access token when it is about to expire.
+
+            The token is cached together with its expiry time (minus a safety buffer),
+            so a refresh round-trip is only paid when the cached token runs out.
+        """
+        if time.monotonic() >= self._token_expiry:
+            self.get_token()
+            self.headers = {
+                'Authorization': 'Bearer ' + self.token,
+                'Content-Type': 'application/json',
+            }
+            self._session.headers.update(self.headers)
+
     def set_snapshot_id(self, snapshot_id):
         """
             Sets the snapshot ID for the API requests.
@@ -134,6 +864,7 @@ class SudskiRegistarDataAPI:
                     if not specified the latest set is returned.
         """
         self.snapshot_id = str(snapshot_id)
+        self._rebuild_base_params()
 
     def set_omit_nulls(self, omit_nulls):
         """
@@ -144,6 +875,7 @@ class SudskiRegistarDataAPI:
                     if not specified null keys are omitted.
         """
         self.omit_nulls = int(omit_nulls)
+        self._rebuild_base_params()
 
     def set_no_data_error(self, no_data_error):
         """
@@ -154,6 +886,21 @@ class SudskiRegistarDataAPI:
                     an error (1) or an empty object (0), if not specified an error is returned.
         """
         self.no_data_error = int(no_data_error)
+        self._rebuild_base_params()
+
+    def _rebuild_base_params(self):
+        """
+            Rebuilds the cached stable query parameters.
+
+            The snapshot_id, no_data_error and omit_nulls parameters only change
+            when one of the setters is called, so they are cached here instead of
+            being re-checked on every request.
+        """
+        self._base_params = {key: value for key, value in (("snapshot_id", self.snapshot_id),
+                                                           ("no_data_error", self.no_data_error),
+                                                           ("omit_nulls", self.omit_nulls))
+                             if value is not None}
+        self._base_qs = urlencode(self._base_params)
 
     def main_parameters(self, expand_relations=None, history_columns=None):
         """
@@ -165,17 +912,8 @@ class SudskiRegistarDataAPI:
                 history_columns (bool, optional): Specifies whether the STATUS, VRIJEDI_OD and VRIJEDI_DO columns
                     are included in historically maintained code lists - if not specified, the columns are not returned.
         """
-        params = {}
-        if self.snapshot_id is not None:
-            params["snapshot_id"] = self.snapshot_id
-        if expand_relations is not None:
-            params["expand_relations"] = int(expand_relations)
-        if history_columns is not None:
-            params["history_columns"] = int(history_columns)
-        if self.no_data_error is not None:
-            params["no_data_error"] = self.no_data_error
-        if self.omit_nulls is not None:
-            params["omit_nulls"] = self.omit_nulls
+        params = self._base_params.copy()
+        params.update(_variable_params(expand_relations, history_columns, None, None))
         return params
 
     def paging_parameters(self, expand_relations=None, offset=None, limit=None):
@@ -190,11 +928,8 @@ class SudskiRegistarDataAPI:
                 limit (int, optional): Specifies the number of rows (page size) for paging,
                     if not specified, 1000 rows are returned.
         """
-        params = self.main_parameters(expand_relations, None)
-        if offset is not None:
-            params["offset"] = offset
-        if limit is not None:
-            params["limit"] = limit
+        params = self._base_params.copy()
+        params.update(_variable_params(expand_relations, None, offset, limit))
         return params
 
     def get_bris_pravni_oblici(self, expand_relations=None, history_columns=None):
@@ -218,9 +953,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "bris_pravni_oblici"
-        params = self.main_parameters(expand_relations, history_columns)
-        return self.execute_get_request(endpoint, params)
+        return self._request("bris_pravni_oblici", expand_relations=expand_relations, history_columns=history_columns)
 
     def get_bris_registri(self, expand_relations=None, history_columns=None):
         """
@@ -242,9 +975,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "bris_registri"
-        params = self.main_parameters(expand_relations, history_columns)
-        return self.execute_get_request(endpoint, params)
+        return self._request("bris_registri", expand_relations=expand_relations, history_columns=history_columns)
 
     def get_counts(self):
         """
@@ -260,9 +991,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "counts"
-        params = self.main_parameters(None, None)
-        return self.execute_get_request(endpoint, params)
+        return self._request("counts")
 
     def get_detalji_subjekta(self, expand_relations=None, tip_identifikatora=None, identifikator=None):
         """
@@ -282,20 +1011,14 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "detalji_subjekta"
-        params = self.main_parameters(expand_relations, None)
-        if tip_identifikatora is not None:
-            if tip_identifikatora in ["oib", "mbs"]:
-                params["tip_identifikatora"] = tip_identifikatora
-            else:
-                raise ValueError("tip_identifikatora must be 'oib' or 'mbs'")
-        else:
+        if tip_identifikatora is None:
             raise ValueError("tip_identifikatora is required")
-        if identifikator is not None:
-            params["identifikator"] = identifikator
-        else:
+        if tip_identifikatora not in _TIP_IDENT_VALID:
+            raise ValueError("tip_identifikatora must be 'oib' or 'mbs'")
+        if identifikator is None:
             raise ValueError("identifikator is required")
-        return self.execute_get_request(endpoint, params)
+        return self._request("detalji_subjekta", expand_relations=expand_relations,
+                             tip_identifikatora=tip_identifikatora, identifikator=identifikator)
 
     def get_djelatnosti_podruznica(self, offset=None, limit=None):
         """
@@ -321,9 +1044,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "djelatnosti_podruznica"
-        params = self.paging_parameters(None, offset, limit)
-        return self.execute_get_request(endpoint, params)
+        return self._request("djelatnosti_podruznica", offset=offset, limit=limit)
 
     def get_drzave(self, history_columns=None):
         """
@@ -340,9 +1061,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "drzave"
-        params = self.main_parameters(None, history_columns)
-        return self.execute_get_request(endpoint, params)
+        return self._request("drzave", history_columns=history_columns)
 
     def get_email_adrese(self, offset=None, limit=None):
         """
@@ -366,9 +1085,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "email_adrese"
-        params = self.paging_parameters(None, offset, limit)
-        return self.execute_get_request(endpoint, params)
+        return self._request("email_adrese", offset=offset, limit=limit)
 
     def get_email_adrese_podruznica(self, offset=None, limit=None):
         """
@@ -392,9 +1109,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "email_adrese_podruznica"
-        params = self.paging_parameters(None, offset, limit)
-        return self.execute_get_request(endpoint, params)
+        return self._request("email_adrese_podruznica", offset=offset, limit=limit)
 
     def get_evidencijske_djelatnosti(self, offset=None, limit=None):
         """
@@ -420,9 +1135,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "evidencijske_djelatnosti"
-        params = self.paging_parameters(None, offset, limit)
-        return self.execute_get_request(endpoint, params)
+        return self._request("evidencijske_djelatnosti", offset=offset, limit=limit)
 
     def get_gfi(self, offset=None, limit=None):
         """
@@ -449,9 +1162,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "gfi"
-        params = self.paging_parameters(None, offset, limit)
-        return self.execute_get_request(endpoint, params)
+        return self._request("gfi", offset=offset, limit=limit)
 
     def get_inozemni_registri(self, offset=None, limit=None):
         """
@@ -476,9 +1187,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "inozemni_registri"
-        params = self.paging_parameters(None, offset, limit)
-        return self.execute_get_request(endpoint, params)
+        return self._request("inozemni_registri", offset=offset, limit=limit)
 
     def get_jezici(self, history_columns=None):
         """
@@ -495,9 +1204,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "jezici"
-        params = self.main_parameters(None, history_columns)
-        return self.execute_get_request(endpoint, params)
+        return self._request("jezici", history_columns=history_columns)
 
     def get_postupci(self, offset=None, limit=None):
         """
@@ -520,9 +1227,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "postupci"
-        params = self.paging_parameters(None, offset, limit)
-        return self.execute_get_request(endpoint, params)
+        return self._request("postupci", offset=offset, limit=limit)
 
     def get_tvrtke(self, offset=None, limit=None):
         """
@@ -548,9 +1253,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "tvrtke"
-        params = self.paging_parameters(None, offset, limit)
-        return self.execute_get_request(endpoint, params)
+        return self._request("tvrtke", offset=offset, limit=limit)
 
     def get_skracene_tvrtke(self, offset=None, limit=None):
         """
@@ -572,9 +1275,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "skracene_tvrtke"
-        params = self.paging_parameters(None, offset, limit)
-        return self.execute_get_request(endpoint, params)
+        return self._request("skracene_tvrtke", offset=offset, limit=limit)
 
     def get_prijevodi_tvrtki(self, offset=None, limit=None):
         """
@@ -597,9 +1298,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "prijevodi_tvrtki"
-        params = self.paging_parameters(None, offset, limit)
-        return self.execute_get_request(endpoint, params)
+        return self._request("prijevodi_tvrtki", offset=offset, limit=limit)
 
     def get_prijevodi_skracenih_tvrtki(self, offset=None, limit=None):
         """
@@ -622,9 +1321,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "prijevodi_skracenih_tvrtki"
-        params = self.paging_parameters(None, offset, limit)
-        return self.execute_get_request(endpoint, params)
+        return self._request("prijevodi_skracenih_tvrtki", offset=offset, limit=limit)
 
     def get_sjedista(self, offset=None, limit=None):
         """
@@ -657,9 +1354,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "sjedista"
-        params = self.paging_parameters(None, offset, limit)
-        return self.execute_get_request(endpoint, params)
+        return self._request("sjedista", offset=offset, limit=limit)
 
     def get_pravni_oblici(self, expand_relations=None, offset=None, limit=None):
         """
@@ -683,9 +1378,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "pravni_oblici"
-        params = self.paging_parameters(expand_relations, offset, limit)
-        return self.execute_get_request(endpoint, params)
+        return self._request("pravni_oblici", expand_relations=expand_relations, offset=offset, limit=limit)
 
     def get_pretezite_djelatnosti(self, offset=None, limit=None):
         """
@@ -709,9 +1402,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "pretezite_djelatnosti"
-        params = self.paging_parameters(None, offset, limit)
-        return self.execute_get_request(endpoint, params)
+        return self._request("pretezite_djelatnosti", offset=offset, limit=limit)
 
     def get_predmeti_poslovanja(self, expand_relations=None, offset=None, limit=None):
         """
@@ -742,9 +1433,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "predmeti_poslovanja"
-        params = self.paging_parameters(expand_relations, offset, limit)
-        return self.execute_get_request(endpoint, params)
+        return self._request("predmeti_poslovanja", expand_relations=expand_relations, offset=offset, limit=limit)
 
     def get_temeljni_kapitali(self, offset=None, limit=None):
         """
@@ -769,9 +1458,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "temeljni_kapitali"
-        params = self.paging_parameters(None, offset, limit)
-        return self.execute_get_request(endpoint, params)
+        return self._request("temeljni_kapitali", offset=offset, limit=limit)
 
     def get_nazivi_podruznica(self, offset=None, limit=None):
         """
@@ -805,9 +1492,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "nazivi_podruznica"
-        params = self.paging_parameters(None, offset, limit)
-        return self.execute_get_request(endpoint, params)
+        return self._request("nazivi_podruznica", offset=offset, limit=limit)
 
     def get_skraceni_nazivi_podruznica(self, offset=None, limit=None):
         """
@@ -830,9 +1515,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "skraceni_nazivi_podruznica"
-        params = self.paging_parameters(None, offset, limit)
-        return self.execute_get_request(endpoint, params)
+        return self._request("skraceni_nazivi_podruznica", offset=offset, limit=limit)
 
     def get_sjedista_podruznica(self, offset=None, limit=None):
         """
@@ -864,9 +1547,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "sjedista_podruznica"
-        params = self.paging_parameters(None, offset, limit)
-        return self.execute_get_request(endpoint, params)
+        return self._request("sjedista_podruznica", offset=offset, limit=limit)
 
     def get_objave_priopcenja(self, offset=None, limit=None):
         """
@@ -890,9 +1571,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "objave_priopcenja"
-        params = self.paging_parameters(None, offset, limit)
-        return self.execute_get_request(endpoint, params)
+        return self._request("objave_priopcenja", offset=offset, limit=limit)
 
     def get_promjene(self, offset=None, limit=None):
         """
@@ -916,9 +1595,34 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "promjene"
-        params = self.paging_parameters(None, offset, limit)
-        return self.execute_get_request(endpoint, params)
+        return self._request("promjene", offset=offset, limit=limit)
+
+    def get_promjene_keys(self, keys=("MBS", "SCN"), offset=None, limit=None):
+        """
+            List of recent changes to entities, projected down to the given keys.
+
+            Consumers of promjene typically only read MBS and SCN to diff two
+            snapshots; projecting each row to those keys right after the parse
+            drops the unused field objects instead of keeping whole rows alive
+            while the comparison runs.
+
+            Args:
+                keys (tuple, optional): The row fields to keep, by default MBS and SCN.
+                offset (int, optional): Specifies the starting row for paging.
+                limit (int, optional): Specifies the number of rows (page size) for paging,
+                    if not specified, 1000 rows are returned.
+
+            Returns:
+                list: The projected rows, one dict per row with only the given keys.
+
+           Raises:
+               requests.HTTPError: If the API response was unsuccessful.
+        """
+
+        rows = self._request("promjene", offset=offset, limit=limit)
+        if not isinstance(rows, list):
+            return rows
+        return [{key: row.get(key) for key in keys} for row in rows]
 
     def get_subjekti(self, tvrtka_naziv=None, only_active=None, offset=None, limit=None):
         """
@@ -956,13 +1660,8 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "subjekti"
-        params = self.paging_parameters(None, offset, limit)
-        if tvrtka_naziv is not None:
-            params["tvrtka_naziv"] = tvrtka_naziv
-        if only_active is not None:
-            params["only_active"] = only_active
-        return self.execute_get_request(endpoint, params)
+        return self._request("subjekti", offset=offset, limit=limit,
+                             tvrtka_naziv=tvrtka_naziv, only_active=only_active)
 
     def get_snapshots(self):
         """
@@ -986,13 +1685,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "snapshots"
-        params = {}
-        if self.no_data_error is not None:
-            params["no_data_error"] = self.no_data_error
-        if self.omit_nulls is not None:
-            params["omit_nulls"] = self.omit_nulls
-        return self.execute_get_request(endpoint, params)
+        return self._request("snapshots")
 
     def get_nacionalna_klasifikacija_djelatnosti(self, history_columns=None):
         """
@@ -1016,9 +1709,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "nacionalna_klasifikacija_djelatnosti"
-        params = self.main_parameters(None, history_columns)
-        return self.execute_get_request(endpoint, params)
+        return self._request("nacionalna_klasifikacija_djelatnosti", history_columns=history_columns)
 
     def get_statusi(self):
         """
@@ -1033,9 +1724,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "statusi"
-        params = self.main_parameters(None, None)
-        return self.execute_get_request(endpoint, params)
+        return self._request("statusi")
 
     def get_sudovi(self, expand_relations=None, history_columns=None):
         """
@@ -1060,9 +1749,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "sudovi"
-        params = self.main_parameters(expand_relations, history_columns)
-        return self.execute_get_request(endpoint, params)
+        return self._request("sudovi", expand_relations=expand_relations, history_columns=history_columns)
 
     def get_valute(self, expand_relations=None, history_columns=None):
         """
@@ -1081,9 +1768,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "valute"
-        params = self.main_parameters(expand_relations, history_columns)
-        return self.execute_get_request(endpoint, params)
+        return self._request("valute", expand_relations=expand_relations, history_columns=history_columns)
 
     def get_vrste_gfi_dokumenata(self):
         """
@@ -1096,9 +1781,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "vrste_gfi_dokumenata"
-        params = self.main_parameters(None, None)
-        return self.execute_get_request(endpoint, params)
+        return self._request("vrste_gfi_dokumenata")
 
     def get_vrste_postupaka(self):
         """
@@ -1113,9 +1796,7 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "vrste_postupaka"
-        params = self.main_parameters(None, None)
-        return self.execute_get_request(endpoint, params)
+        return self._request("vrste_postupaka")
 
     def get_vrste_pravnih_oblika(self, history_columns=None):
         """
@@ -1132,6 +1813,4 @@ class SudskiRegistarDataAPI:
                requests.HTTPError: If the API response was unsuccessful.
         """
 
-        endpoint = "vrste_pravnih_oblika"
-        params = self.main_parameters(None, history_columns)
-        return self.execute_get_request(endpoint, params)
+        return self._request("vrste_pravnih_oblika", history_columns=history_columns)